@@ -0,0 +1,68 @@
+"""Process-local caches for small, rarely changing catalog lookup tables.
+
+Each worker keeps its own copy, keyed by a version counter that catalog.signals
+bumps when a transaction saving or deleting an Attribute, AttributeValue or
+Category commits; until then that transaction reads around the cache, so
+uncommitted rows are never cached and a rollback leaves nothing to evict.
+Writes made through queryset.update() or in another process are not seen until
+the next bump in this one. Returned instances are shared: treat them as read-only.
+"""
+from functools import lru_cache
+
+from django.db import transaction
+
+from common.transactions import pending_on_commit
+
+from .models import Attribute, AttributeValue, Category
+
+_version = 0
+
+
+def bump():
+    global _version
+    _version += 1
+
+
+class _Bump:
+    def __call__(self):
+        bump()
+
+
+def invalidate():
+    """Bump once the current transaction commits (at once outside a transaction)."""
+    if pending_on_commit(_Bump) is None:
+        transaction.on_commit(_Bump())
+
+
+def _cached(lookup):
+    if pending_on_commit(_Bump) is not None:
+        return lookup.__wrapped__(_version)
+    return lookup(_version)
+
+
+@lru_cache(maxsize=1)
+def _attributes(version):
+    return {a.pk: a for a in Attribute.objects.all()}
+
+
+@lru_cache(maxsize=1)
+def _attribute_values(version):
+    return {av.pk: av for av in AttributeValue.objects.select_related('attribute')}
+
+
+@lru_cache(maxsize=1)
+def _categories(version):
+    # Full rows: a deferred field would query and mutate the shared instance on access
+    return {c.pk: c for c in Category.objects.all()}
+
+
+def all_attributes():
+    return _cached(_attributes)
+
+
+def all_attribute_values():
+    return _cached(_attribute_values)
+
+
+def all_categories():
+    return _cached(_categories)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from catalog.models import CategoryFacetCount
+
+
+class Command(BaseCommand):
+    help = 'Refresh the catalog_facet_counts materialized view (no-op outside PostgreSQL).'
+
+    def handle(self, *args, **options):
+        CategoryFacetCount.refresh()
+        self.stdout.write(self.style.SUCCESS('Facet counts refreshed.'))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='category',
+            name='catalog_cat_slug_695af4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='catalog_pro_slug_2b1eb6_idx',
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:33
+
+import common.uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_drop_redundant_slug_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attribute',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='attributevalue',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='brand',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='productimage',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='productvariant',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
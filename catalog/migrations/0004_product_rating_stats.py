@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:34
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_rating_stats(apps, schema_editor):
+    Product = apps.get_model('catalog', 'Product')
+    Review = apps.get_model('catalog', 'Review')
+    published = Review.objects.filter(product=OuterRef('pk'), published=True).order_by().values('product')
+    stats = {
+        'rating_avg': Coalesce(
+            Subquery(published.annotate(v=Avg('rating')).values('v')),
+            Value(0),
+            output_field=models.DecimalField(max_digits=3, decimal_places=2),
+        ),
+        'rating_count': Coalesce(Subquery(published.annotate(n=Count('pk')).values('n')), Value(0)),
+    }
+    pks = list(Product.objects.filter(reviews__published=True).values_list('pk', flat=True).distinct())
+    for start in range(0, len(pks), BACKFILL_BATCH_SIZE):
+        Product.objects.filter(pk__in=pks[start:start + BACKFILL_BATCH_SIZE]).update(**stats)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='rating_avg',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=3),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:34
+
+from django.db import migrations, models
+
+
+def backfill_attributes_map(apps, schema_editor):
+    ProductVariant = apps.get_model('catalog', 'ProductVariant')
+    variants = ProductVariant.objects.filter(attributes__isnull=False).distinct().prefetch_related('attributes__attribute')
+    for variant in variants.iterator(chunk_size=2000):
+        attrs = {}
+        for av in variant.attributes.all():
+            attrs[av.attribute.name] = av.value
+            if av.hex_code:
+                attrs['hex'] = av.hex_code
+        ProductVariant.objects.filter(pk=variant.pk).update(attributes_map=attrs)
+
+
+# GIN indexes only exist on PostgreSQL; other backends skip this step.
+def create_attributes_map_gin(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS pv_attrs_gin ON catalog_productvariant '
+            'USING gin (attributes_map jsonb_path_ops)'
+        )
+
+
+def drop_attributes_map_gin(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS pv_attrs_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_product_rating_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productvariant',
+            name='attributes_map',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.RunPython(backfill_attributes_map, migrations.RunPython.noop),
+        migrations.RunPython(create_attributes_map_gin, drop_attributes_map_gin),
+    ]
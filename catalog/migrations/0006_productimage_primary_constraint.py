@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:35
+
+from django.db import migrations, models
+
+
+def demote_extra_primary_images(apps, schema_editor):
+    # Keep the first primary image per product so the unique constraint can be added
+    ProductImage = apps.get_model('catalog', 'ProductImage')
+    seen = set()
+    extra = []
+    for pk, product_id in ProductImage.objects.filter(is_primary=True).order_by('product', 'sort_order', 'created_at').values_list('pk', 'product'):
+        if product_id in seen:
+            extra.append(pk)
+        seen.add(product_id)
+    ProductImage.objects.filter(pk__in=extra).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_productvariant_attributes_map'),
+    ]
+
+    operations = [
+        migrations.RunPython(demote_extra_primary_images, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='productimage',
+            index=models.Index(fields=['product', 'sort_order'], name='pi_prod_sort'),
+        ),
+        migrations.AddConstraint(
+            model_name='productimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('product',), name='one_primary_image_per_product'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:36
+
+from django.db import migrations, models
+
+FACET_COUNTS_SELECT = '''
+    SELECT p.category_id, av.attribute_id, av.id AS value_id, COUNT(DISTINCT p.id) AS product_count
+    FROM catalog_productvariant pv
+    JOIN catalog_product p ON p.id = pv.product_id
+    JOIN catalog_productvariant_attributes pva ON pva.productvariant_id = pv.id
+    JOIN catalog_attributevalue av ON av.id = pva.attributevalue_id
+    WHERE pv.is_active AND p.is_active
+    GROUP BY p.category_id, av.attribute_id, av.id
+'''
+
+
+# PostgreSQL gets a materialized view (with the unique index REFRESH ... CONCURRENTLY
+# needs); other backends fall back to a plain view so the model stays queryable.
+def create_facet_counts_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'CREATE MATERIALIZED VIEW catalog_facet_counts AS {FACET_COUNTS_SELECT}')
+        schema_editor.execute(
+            'CREATE UNIQUE INDEX catalog_facet_counts_uniq ON catalog_facet_counts (category_id, attribute_id, value_id)'
+        )
+    else:
+        schema_editor.execute(f'CREATE VIEW catalog_facet_counts AS {FACET_COUNTS_SELECT}')
+
+
+def drop_facet_counts_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP MATERIALIZED VIEW IF EXISTS catalog_facet_counts')
+    else:
+        schema_editor.execute('DROP VIEW IF EXISTS catalog_facet_counts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0006_productimage_primary_constraint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryFacetCount',
+            fields=[
+                ('pk', models.CompositePrimaryKey('category', 'attribute', 'value', blank=True, editable=False, primary_key=True, serialize=False)),
+                ('product_count', models.PositiveIntegerField()),
+            ],
+            options={
+                'db_table': 'catalog_facet_counts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_facet_counts_view, drop_facet_counts_view),
+    ]
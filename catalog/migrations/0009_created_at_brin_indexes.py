@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:42
+
+import common.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0008_check_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='review',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=common.indexes.PortableBrinIndex(fields=['created_at'], name='review_created_brin', pages_per_range=32),
+        ),
+    ]
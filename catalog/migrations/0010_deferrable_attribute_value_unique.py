@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:46
+
+import common.constraints
+import django.db.models.constraints
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0009_created_at_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='attributevalue',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='category',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='attributevalue',
+            constraint=common.constraints.DeferrableUniqueConstraint(deferrable=django.db.models.constraints.Deferrable['DEFERRED'], fields=('attribute', 'value'), name='attrvalue_attr_value_uniq'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0010_deferrable_attribute_value_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='review',
+            name='review_created_brin',
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['-created_at', '-id'], name='review_ks'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 18:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0011_review_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='rating_avg',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=3),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
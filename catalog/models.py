@@ -1,15 +1,56 @@
-import uuid
-from django.db import models
-from django.utils.text import slugify
+import re
+import string
+import unicodedata
+from django.db import connection, models, transaction
+
+from common.constraints import DeferrableUniqueConstraint
+from common.keyset import KeysetMixin
+from common.uuid import uuid7
+
+# ASCII-only slug translation: whitespace/separators become '-', other
+# punctuation and control characters are dropped, letters and digits pass
+# through unchanged.
+_SLUG_SEPARATORS = string.whitespace + '-_/\\.,;:'
+_SLUG_CONTROLS = ''.join(map(chr, range(32))) + '\x7f'
+_SLUG_TABLE = str.maketrans(
+    {c: '-' if c in _SLUG_SEPARATORS else None for c in _SLUG_SEPARATORS + string.punctuation + _SLUG_CONTROLS}
+)
+_SLUG_STRIP = re.compile(r'-+')
+
+
+def _fast_slugify(name, maxlen):
+    s = name.strip().lower()
+    if not s.isascii():
+        s = unicodedata.normalize('NFKD', s).encode('ascii', 'ignore').decode()
+    return _SLUG_STRIP.sub('-', s.translate(_SLUG_TABLE)).strip('-')[:maxlen]
 
 class TimeStampedModel(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         abstract = True
 
+class CatalogManager(models.Manager):
+    def bulk_create_with_slugs(self, objs, batch_size=1000):
+        # bulk_create() skips pre_save, so fill slugs here before inserting
+        objs = list(objs)
+        max_length = self.model._meta.get_field('slug').max_length
+        for obj in objs:
+            if not obj.slug:
+                obj.slug = _fast_slugify(obj.name, max_length)
+        return self.bulk_create(objs, batch_size=batch_size)
+
+class ListingManager(models.Manager):
+    # For list pages: defers heavy text columns that only detail views render
+    def __init__(self, *deferred):
+        super().__init__()
+        self.deferred = deferred
+
+    def get_queryset(self):
+        return super().get_queryset().defer(*self.deferred)
+
 class Category(TimeStampedModel):
     name = models.CharField(max_length=120)
     slug = models.SlugField(max_length=140, unique=True, blank=True)
@@ -18,16 +59,13 @@ class Category(TimeStampedModel):
     is_active = models.BooleanField(default=True)
     sort_order = models.PositiveIntegerField(default=0)
 
+    objects = CatalogManager()
+    listing = ListingManager('description')
+
     class Meta:
-        unique_together = [('parent', 'slug')]
-        indexes = [models.Index(fields=['slug']), models.Index(fields=['parent', 'sort_order'])]
+        indexes = [models.Index(fields=['parent', 'sort_order'])]
         ordering = ['parent__id', 'sort_order', 'name']
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)[:140]
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return self.name
 
@@ -35,10 +73,7 @@ class Brand(TimeStampedModel):
     name = models.CharField(max_length=120, unique=True)
     slug = models.SlugField(max_length=140, unique=True, blank=True)
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)[:140]
-        super().save(*args, **kwargs)
+    objects = CatalogManager()
 
     def __str__(self):
         return self.name
@@ -56,18 +91,29 @@ class Product(TimeStampedModel):
     base_price = models.DecimalField(max_digits=10, decimal_places=2)  # default display
     currency = models.CharField(max_length=3, default='INR')
     tax_rate_percent = models.DecimalField(max_digits=5, decimal_places=2, default=0)  # optional
+    # Denormalized from published reviews; maintained by catalog.signals only
+    rating_avg = models.DecimalField(max_digits=3, decimal_places=2, default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
 
-    class Meta:
-        indexes = [models.Index(fields=['slug']), models.Index(fields=['is_active', 'is_featured'])]
+    objects = CatalogManager()
+    listing = ListingManager('description', 'meta_title', 'meta_description')
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)[:220]
-        super().save(*args, **kwargs)
+    class Meta:
+        indexes = [models.Index(fields=['is_active', 'is_featured'])]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # Updates never write the rating stats: this instance may predate the
+        # last review commit, and saving would put its stale copy back.
+        if not self._state.adding:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [f.name for f in self._meta.concrete_fields if not f.primary_key]
+            kwargs['update_fields'] = [name for name in update_fields if name not in ('rating_avg', 'rating_count')]
+        super().save(*args, **kwargs)
+
 class ProductImage(TimeStampedModel):
     product = models.ForeignKey(Product, related_name='images', on_delete=models.CASCADE)
     image = models.ImageField(upload_to='products/%Y/%m/')
@@ -77,6 +123,16 @@ class ProductImage(TimeStampedModel):
 
     class Meta:
         ordering = ['sort_order', 'created_at']
+        indexes = [models.Index(fields=['product', 'sort_order'], name='pi_prod_sort')]
+        constraints = [
+            models.UniqueConstraint(fields=['product'], condition=models.Q(is_primary=True), name='one_primary_image_per_product'),
+        ]
+
+    def make_primary(self):
+        with transaction.atomic():
+            ProductImage.objects.filter(product_id=self.product_id, is_primary=True).exclude(pk=self.pk).update(is_primary=False)
+            self.is_primary = True
+            self.save(update_fields=['is_primary', 'updated_at'])
 
 class Attribute(TimeStampedModel):
     # e.g., Color, Size, Fabric, Occasion
@@ -91,7 +147,8 @@ class AttributeValue(TimeStampedModel):
     hex_code = models.CharField(max_length=7, blank=True)  # for colors like #ff00aa
 
     class Meta:
-        unique_together = [('attribute', 'value')]
+        # Checked at commit so values can be swapped/renamed in one transaction
+        constraints = [DeferrableUniqueConstraint(fields=['attribute', 'value'], name='attrvalue_attr_value_uniq')]
 
     def __str__(self):
         return f'{self.attribute.name}: {self.value}'
@@ -101,6 +158,9 @@ class ProductVariant(TimeStampedModel):
     sku = models.CharField(max_length=40, unique=True)
     # Flexible attributes via M2M through a mapping table
     attributes = models.ManyToManyField(AttributeValue, related_name='variants', blank=True)
+    # Read-side copy of `attributes`, e.g. {"Color": "Red", "Size": "M", "hex": "#ff0000"};
+    # kept in sync by catalog.signals so listings need no M2M joins
+    attributes_map = models.JSONField(default=dict, blank=True, editable=False)
     mrp_price = models.DecimalField(max_digits=10, decimal_places=2)   # original price
     sale_price = models.DecimalField(max_digits=10, decimal_places=2)  # display price
     stock = models.PositiveIntegerField(default=0)
@@ -110,22 +170,60 @@ class ProductVariant(TimeStampedModel):
     class Meta:
         indexes = [models.Index(fields=['sku']), models.Index(fields=['is_active'])]
         constraints = [
-            models.CheckConstraint(check=models.Q(sale_price__gte=0), name='variant_sale_price_nonneg'),
-            models.CheckConstraint(check=models.Q(mrp_price__gte=0), name='variant_mrp_price_nonneg'),
+            models.CheckConstraint(condition=models.Q(sale_price__gte=0), name='variant_sale_price_nonneg'),
+            models.CheckConstraint(condition=models.Q(mrp_price__gte=0), name='variant_mrp_price_nonneg'),
         ]
 
     def __str__(self):
         return f'{self.product.name} ({self.sku})'
 
-class Review(TimeStampedModel):
+    def sync_attributes_map(self):
+        attrs = {}
+        for av in self.attributes.select_related('attribute'):
+            attrs[av.attribute.name] = av.value
+            if av.hex_code:
+                attrs['hex'] = av.hex_code
+        self.attributes_map = attrs
+        ProductVariant.objects.filter(pk=self.pk).update(attributes_map=attrs)
+
+class Review(KeysetMixin, TimeStampedModel):
+    created_at = models.DateTimeField(auto_now_add=True)  # indexed by review_ks, not the inherited btree
     product = models.ForeignKey(Product, related_name='reviews', on_delete=models.CASCADE)
     user = models.ForeignKey('auth.User', related_name='reviews', on_delete=models.SET_NULL, null=True, blank=True)
-    rating = models.PositiveSmallIntegerField()  # 1-5
+    rating = models.PositiveSmallIntegerField()  # 1-5, enforced by review_rating_1_5
     title = models.CharField(max_length=120, blank=True)
     comment = models.TextField(blank=True)
     is_verified = models.BooleanField(default=False)
     published = models.BooleanField(default=True)
 
+    objects = models.Manager()
+    listing = ListingManager('comment')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['product', 'rating', 'published']),
+            models.Index(fields=['-created_at', '-id'], name='review_ks'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(rating__gte=1, rating__lte=5), name='review_rating_1_5'),
+        ]
+        ordering = ['-created_at']
+
+class CategoryFacetCount(models.Model):
+    # Read-only view over active variants (materialized on PostgreSQL);
+    # refresh with `manage.py refresh_facet_counts`
+    pk = models.CompositePrimaryKey('category', 'attribute', 'value')
+    category = models.ForeignKey(Category, related_name='+', on_delete=models.DO_NOTHING)
+    attribute = models.ForeignKey(Attribute, related_name='+', on_delete=models.DO_NOTHING)
+    value = models.ForeignKey(AttributeValue, related_name='+', on_delete=models.DO_NOTHING)
+    product_count = models.PositiveIntegerField()
+
     class Meta:
-        indexes = [models.Index(fields=['product', 'rating', 'published'])]
-        ordering = ['-created_at']
\ No newline at end of file
+        managed = False
+        db_table = 'catalog_facet_counts'
+
+    @classmethod
+    def refresh(cls):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}')
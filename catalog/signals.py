@@ -0,0 +1,111 @@
+from django.db.models import Avg, Count, DecimalField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from common.transactions import OnCommitBatch, on_commit_batch
+
+from . import cache
+from .models import Attribute, AttributeValue, Brand, Category, Product, ProductVariant, Review, _fast_slugify
+
+
+@receiver(pre_save, sender=Category)
+@receiver(pre_save, sender=Brand)
+@receiver(pre_save, sender=Product)
+def fill_slug(sender, instance, **kwargs):
+    if not instance.slug:
+        instance.slug = _fast_slugify(instance.name, sender._meta.get_field('slug').max_length)
+
+
+def rating_stats_update(review_model):
+    """Update kwargs that recompute rating_avg/rating_count from published reviews."""
+    published = review_model.objects.filter(product=OuterRef('pk'), published=True).order_by().values('product')
+    return {
+        'rating_avg': Coalesce(
+            Subquery(published.annotate(v=Avg('rating')).values('v')),
+            Value(0),
+            output_field=DecimalField(max_digits=3, decimal_places=2),
+        ),
+        'rating_count': Coalesce(Subquery(published.annotate(n=Count('pk')).values('n')), Value(0)),
+    }
+
+
+class _RefreshRatings(OnCommitBatch):
+    def run(self):
+        Product.objects.filter(pk__in=self).update(**rating_stats_update(Review))
+
+
+@receiver(pre_save, sender=Review)
+def review_saving(sender, instance, update_fields=None, **kwargs):
+    # A review moved to another product changes the old product's stats too
+    if not instance._state.adding and (update_fields is None or 'product' in update_fields):
+        instance._previous_product_id = (
+            Review.objects.filter(pk=instance.pk).values_list('product_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_changed(sender, instance, **kwargs):
+    # Defer to commit so a batch of review writes in one transaction refreshes
+    # each product once, with one UPDATE, and rollbacks leave them untouched.
+    product_ids = {instance.product_id, instance.__dict__.pop('_previous_product_id', None)}
+    on_commit_batch(_RefreshRatings, product_ids - {None})
+
+
+@receiver(m2m_changed, sender=ProductVariant.attributes.through)
+def variant_attributes_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        # pk_set is None for clear(); remember which variants lose this value
+        instance._cleared_variant_pks = set(instance.variants.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        instance.sync_attributes_map()
+        return
+    if action == 'post_clear':
+        pk_set = instance.__dict__.pop('_cleared_variant_pks', set())
+    for variant in ProductVariant.objects.filter(pk__in=pk_set):
+        variant.sync_attributes_map()
+
+
+@receiver(post_save, sender=AttributeValue)
+def attribute_value_saved(sender, instance, created, **kwargs):
+    if not created:
+        for variant in instance.variants.all():
+            variant.sync_attributes_map()
+
+
+@receiver(post_save, sender=Attribute)
+def attribute_saved(sender, instance, created, **kwargs):
+    if not created:
+        for variant in ProductVariant.objects.filter(attributes__attribute=instance).distinct():
+            variant.sync_attributes_map()
+
+
+class _ResyncVariants(OnCommitBatch):
+    def run(self):
+        for variant in ProductVariant.objects.filter(pk__in=self):
+            variant.sync_attributes_map()
+
+
+@receiver(pre_delete, sender=AttributeValue)
+def attribute_value_deleting(sender, instance, **kwargs):
+    # The through rows go with the cascade, which sends no m2m_changed
+    on_commit_batch(_ResyncVariants, instance.variants.values_list('pk', flat=True))
+
+
+@receiver(pre_delete, sender=Attribute)
+def attribute_deleting(sender, instance, **kwargs):
+    on_commit_batch(_ResyncVariants, ProductVariant.objects.filter(attributes__attribute=instance).values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Attribute)
+@receiver(post_delete, sender=Attribute)
+@receiver(post_save, sender=AttributeValue)
+@receiver(post_delete, sender=AttributeValue)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def catalog_lookup_changed(sender, **kwargs):
+    cache.invalidate()
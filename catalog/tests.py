@@ -1,3 +1,139 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.db import connection, transaction
+from django.forms import modelform_factory
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.utils.text import slugify
+
+from . import cache, signals
+from .models import Attribute, AttributeValue, Category, Product, ProductVariant, Review, _fast_slugify
+
+
+class FastSlugifyTests(SimpleTestCase):
+    def test_matches_slugify(self):
+        for name in ["Men's Tops & Tees", 'Café Noir', '  Spaced   Out  ', 'Kids 2-4 Years', 'Line\tBreak\nHere', 'Tab\x01Name\x7f']:
+            with self.subTest(name=name):
+                self.assertEqual(_fast_slugify(name, 140), slugify(name))
+
+    def test_separators_become_hyphens(self):
+        # Unlike slugify(), which drops '/' and keeps '_'
+        self.assertEqual(_fast_slugify('Kurta/Pyjama Set', 140), 'kurta-pyjama-set')
+        self.assertEqual(_fast_slugify('T-Shirt_Basic', 140), 't-shirt-basic')
+
+    def test_max_length(self):
+        self.assertEqual(_fast_slugify('Extra Long Name', 9), 'extra-lon')
+
+
+class LookupCacheTests(TransactionTestCase):
+    # Needs real commits: inside TestCase's wrapping transaction the bump never fires.
+
+    def setUp(self):
+        cache.bump()
+        self.color = Attribute.objects.create(name='Color')
+        self.assertEqual(set(cache.all_attributes()), {self.color.pk})
+
+    def test_cached_categories_are_complete(self):
+        Category.objects.create(name='Shirts', description='Formal and casual')
+        categories = list(cache.all_categories().values())
+        with self.assertNumQueries(0):
+            self.assertEqual([c.description for c in categories], ['Formal and casual'])
+
+    def test_rolled_back_write_is_not_cached(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            size = Attribute.objects.create(name='Size')
+            self.assertIn(size.pk, cache.all_attributes())
+            raise RuntimeError
+
+        with self.assertNumQueries(0):
+            self.assertEqual(set(cache.all_attributes()), {self.color.pk})
+
+    def test_committed_write_bumps_cache_once(self):
+        with transaction.atomic():
+            size = Attribute.objects.create(name='Size')
+            Attribute.objects.create(name='Fabric')
+            self.assertEqual(len(connection.run_on_commit), 1)
+            self.assertIn(size.pk, cache.all_attributes())
+
+        self.assertIn(size.pk, cache.all_attributes())
+        with self.assertNumQueries(0):
+            cache.all_attributes()
+
+
+class AttributesMapTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        product = Product.objects.create(name='Shirt', category=Category.objects.create(name='Shirts'), base_price=10)
+        cls.color = Attribute.objects.create(name='Color')
+        cls.red = AttributeValue.objects.create(attribute=cls.color, value='Red', hex_code='#ff0000')
+        cls.size = AttributeValue.objects.create(attribute=Attribute.objects.create(name='Size'), value='M')
+        cls.variant = ProductVariant.objects.create(product=product, sku='SHIRT-RED-M', mrp_price=10, sale_price=10)
+        cls.variant.attributes.add(cls.red, cls.size)
+
+    def assertAttributesMap(self, expected):
+        self.variant.refresh_from_db()
+        self.assertEqual(self.variant.attributes_map, expected)
+
+    def test_add(self):
+        self.assertAttributesMap({'Color': 'Red', 'hex': '#ff0000', 'Size': 'M'})
+
+    def test_delete_attribute_value(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.size.delete()
+        self.assertAttributesMap({'Color': 'Red', 'hex': '#ff0000'})
+
+    def test_delete_attribute(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.color.delete()
+        self.assertEqual(sum(isinstance(c, signals._ResyncVariants) for c in callbacks), 1)
+        self.assertAttributesMap({'Size': 'M'})
+
+
+class ReviewRatingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Shirts')
+        cls.shirt = Product.objects.create(name='Shirt', category=category, base_price=10)
+        cls.tee = Product.objects.create(name='Tee', category=category, base_price=10)
+
+    def assertRating(self, product, avg, count):
+        product.refresh_from_db()
+        self.assertEqual((product.rating_avg, product.rating_count), (Decimal(avg), count))
+
+    def test_batch_refreshes_each_product_once(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for rating in (3, 4, 5):
+                Review.objects.create(product=self.shirt, rating=rating)
+            Review.objects.create(product=self.tee, rating=2)
+        self.assertEqual(len(callbacks), 1)
+        self.assertRating(self.shirt, '4.00', 3)
+        self.assertRating(self.tee, '2.00', 1)
+
+    def test_moving_review_refreshes_both_products(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            review = Review.objects.create(product=self.shirt, rating=4)
+        with self.captureOnCommitCallbacks(execute=True):
+            review.product = self.tee
+            review.save()
+        self.assertRating(self.shirt, '0', 0)
+        self.assertRating(self.tee, '4.00', 1)
+
+    def test_stale_product_save_keeps_stats(self):
+        stale = Product.objects.get(pk=self.shirt.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            Review.objects.create(product=self.shirt, rating=4)
+        stale.name = 'Renamed shirt'
+        stale.save()
+        self.assertRating(self.shirt, '4.00', 1)
+        self.assertEqual(self.shirt.name, 'Renamed shirt')
+
+    def test_stats_not_in_forms(self):
+        form = modelform_factory(Product, fields='__all__')()
+        self.assertNotIn('rating_avg', form.fields)
+        self.assertNotIn('rating_count', form.fields)
+
+    def test_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            review = Review.objects.create(product=self.shirt, rating=4)
+        with self.captureOnCommitCallbacks(execute=True):
+            review.delete()
+        self.assertRating(self.shirt, '0', 0)
@@ -0,0 +1,38 @@
+import copy
+
+from django.db import models
+
+
+class DeferrableUniqueConstraint(models.UniqueConstraint):
+    """UniqueConstraint checked at COMMIT where the backend supports it.
+
+    Backends without deferrable unique constraints (e.g. SQLite) get an
+    ordinary immediate constraint instead of none at all, which is what a
+    plain ``UniqueConstraint(deferrable=...)`` would do there.
+    """
+
+    def __init__(self, *args, deferrable=models.Deferrable.DEFERRED, **kwargs):
+        super().__init__(*args, deferrable=deferrable, **kwargs)
+
+    def _for_connection(self, connection):
+        if connection.features.supports_deferrable_unique_constraints:
+            return self
+        immediate = copy.copy(self)
+        immediate.deferrable = None
+        return immediate
+
+    def _check(self, model, connection):
+        # W038 warns the constraint is skipped; here it falls back to an immediate one
+        return [error for error in super()._check(model, connection) if error.id != 'models.W038']
+
+    def constraint_sql(self, model, schema_editor):
+        constraint = self._for_connection(schema_editor.connection)
+        return super(DeferrableUniqueConstraint, constraint).constraint_sql(model, schema_editor)
+
+    def create_sql(self, model, schema_editor):
+        constraint = self._for_connection(schema_editor.connection)
+        return super(DeferrableUniqueConstraint, constraint).create_sql(model, schema_editor)
+
+    def remove_sql(self, model, schema_editor):
+        constraint = self._for_connection(schema_editor.connection)
+        return super(DeferrableUniqueConstraint, constraint).remove_sql(model, schema_editor)
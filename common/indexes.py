@@ -0,0 +1,15 @@
+from django.contrib.postgres.indexes import BrinIndex
+from django.db.models import Index
+
+
+class PortableBrinIndex(BrinIndex):
+    """BRIN index on PostgreSQL, plain btree on other backends.
+
+    Meant for append-only tables whose rows stay physically ordered by the
+    indexed column (e.g. created_at), where BRIN is a tiny fraction of a btree.
+    """
+
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        if schema_editor.connection.vendor != 'postgresql':
+            return Index.create_sql(self, model, schema_editor, using=using, **kwargs)
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
@@ -0,0 +1,33 @@
+from django.db.models import Q
+
+
+class KeysetMixin:
+    """Newest-first keyset pagination on ``(order_field, id)``.
+
+    Unlike OFFSET, the cost of a page doesn't grow with its depth as long as
+    an index on ``(order_field, id)`` backs the ordering.
+    """
+
+    @classmethod
+    def keyset_page(cls, after=None, limit=20, order_field='created_at', queryset=None):
+        """Return up to ``limit`` rows strictly after the ``(value, pk)`` cursor ``after``.
+
+        Pass the last row's ``(getattr(row, order_field), row.pk)`` as ``after`` to
+        fetch the next page. ``queryset`` narrows the rows (e.g. one user's orders).
+        """
+        return list(cls.keyset_queryset(after, order_field, queryset)[:limit])
+
+    @classmethod
+    def keyset_queryset(cls, after=None, order_field='created_at', queryset=None):
+        """The ordered, unsliced queryset behind keyset_page()."""
+        qs = cls._default_manager.all() if queryset is None else queryset
+        qs = qs.order_by(f'-{order_field}', '-pk')
+        if after is not None:
+            value, pk = after
+            # The redundant <= conjunct lets the index seek to the cursor; the OR alone
+            # is no index condition, so deep pages would scan every newer row.
+            qs = qs.filter(
+                Q(**{f'{order_field}__lte': value}),
+                Q(**{f'{order_field}__lt': value}) | Q(**{order_field: value, 'pk__lt': pk}),
+            )
+        return qs
@@ -0,0 +1,42 @@
+from django.db import transaction
+
+
+def pending_on_commit(callback_type, using=None):
+    """Return the newest ``callback_type`` instance queued on the current transaction, or None.
+
+    Django discards the callbacks of rolled-back savepoints, so a hit means the
+    writes that queued it are still live and will either commit or roll back.
+    """
+    for _, func, _ in reversed(transaction.get_connection(using).run_on_commit):
+        if isinstance(func, callback_type):
+            return func
+    return None
+
+
+class OnCommitBatch(set):
+    """Keys collected by on_commit_batch() and handled by one ``run()`` at commit."""
+
+    executed = False
+
+    def __call__(self):
+        self.executed = True
+        self.run()
+
+    def run(self):
+        raise NotImplementedError
+
+
+def on_commit_batch(batch_type, items, using=None):
+    """Add ``items`` to the one ``batch_type`` callback queued on the current transaction.
+
+    Many writes in a transaction then share a single deduplicated callback
+    instead of queuing one each.
+    """
+    batch = pending_on_commit(batch_type, using)
+    # TestCase.captureOnCommitCallbacks(execute=True) runs callbacks without
+    # dequeuing them; don't add to a batch that has already run.
+    if batch is not None and not batch.executed:
+        batch.update(items)
+        return
+    batch = batch_type(items)
+    transaction.on_commit(batch, using=using)
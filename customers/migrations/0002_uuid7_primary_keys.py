@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:33
+
+import common.uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='address',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='customerprofile',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
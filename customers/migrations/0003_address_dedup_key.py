@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:45
+
+import hashlib
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def _addr_key(a):
+    parts = (a.full_name, a.phone, a.line1, a.line2, a.city, a.state, a.pincode, a.country)
+    canonical = '|'.join(' '.join(p.split()).lower() for p in parts)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def dedupe_addresses(apps, schema_editor):
+    # Fill dedup_key and fold duplicates into the oldest copy, repointing orders at it
+    Address = apps.get_model('customers', 'Address')
+    Order = apps.get_model('orders', 'Order')
+    keep = {}
+    for address in Address.objects.order_by('created_at').iterator(chunk_size=2000):
+        key = _addr_key(address)
+        kept = keep.get((address.user_id, key))
+        if kept is None:
+            keep[(address.user_id, key)] = address
+            Address.objects.filter(pk=address.pk).update(dedup_key=key)
+            continue
+        Order.objects.filter(billing_address=address).update(billing_address=kept)
+        Order.objects.filter(shipping_address=address).update(shipping_address=kept)
+        if address.is_default and not kept.is_default:
+            kept.is_default = True
+            Address.objects.filter(pk=kept.pk).update(is_default=True)
+        address.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_uuid7_primary_keys'),
+        ('orders', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='address',
+            name='dedup_key',
+            field=models.CharField(default='', editable=False, max_length=32),
+            preserve_default=False,
+        ),
+        migrations.RunPython(dedupe_addresses, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='address',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='addresses', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='address',
+            constraint=models.UniqueConstraint(fields=('user', 'dedup_key'), name='address_user_dedup'),
+        ),
+    ]
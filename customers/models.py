@@ -1,9 +1,12 @@
-import uuid
+import hashlib
+
 from django.db import models
 from django.conf import settings
 
+from common.uuid import uuid7
+
 class TimeStampedModel(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     class Meta:
@@ -17,8 +20,18 @@ class CustomerProfile(TimeStampedModel):
     def __str__(self):
         return self.user.get_username()
 
+def _addr_key(a):
+    parts = (a.full_name, a.phone, a.line1, a.line2, a.city, a.state, a.pincode, a.country)
+    canonical = '|'.join(' '.join(p.split()).lower() for p in parts)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+class AddressManager(models.Manager):
+    def get_or_create_deduped(self, user, **fields):
+        key = _addr_key(self.model(user=user, **fields))
+        return self.get_or_create(user=user, dedup_key=key, defaults=fields)
+
 class Address(TimeStampedModel):
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='addresses', on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='addresses', on_delete=models.CASCADE, db_index=False)  # covered by address_user_dedup
     full_name = models.CharField(max_length=100)
     phone = models.CharField(max_length=20)
     line1 = models.CharField(max_length=120)
@@ -28,6 +41,18 @@ class Address(TimeStampedModel):
     pincode = models.CharField(max_length=10)
     country = models.CharField(max_length=60, default='India')
     is_default = models.BooleanField(default=False)
+    # blake2b of the normalized address fields, maintained in save()
+    dedup_key = models.CharField(max_length=32, editable=False)
+
+    objects = AddressManager()
 
     class Meta:
-        ordering = ['-is_default', 'created_at']
\ No newline at end of file
+        ordering = ['-is_default', 'created_at']
+        constraints = [models.UniqueConstraint(fields=['user', 'dedup_key'], name='address_user_dedup')]
+
+    def save(self, *args, **kwargs):
+        self.dedup_key = _addr_key(self)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'dedup_key'}
+        super().save(*args, **kwargs)
\ No newline at end of file
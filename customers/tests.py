@@ -1,3 +1,77 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 
-# Create your tests here.
+from orders.models import Order
+
+from .models import Address, _addr_key
+
+ADDRESS = dict(full_name='Asha Rao', phone='98450 00000', line1='12 MG Road', city='Bengaluru', state='Karnataka', pincode='560001')
+
+
+class AddressDedupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(username='asha')
+
+    def test_normalized_duplicate_returns_existing(self):
+        address, created = Address.objects.get_or_create_deduped(self.user, **ADDRESS)
+        self.assertTrue(created)
+
+        messy = {**ADDRESS, 'full_name': '  asha   RAO ', 'line1': '12  mg road', 'city': 'BENGALURU'}
+        again, created = Address.objects.get_or_create_deduped(self.user, **messy)
+
+        self.assertFalse(created)
+        self.assertEqual(again, address)
+        self.assertEqual(Address.objects.count(), 1)
+
+    def test_other_user_gets_own_copy(self):
+        other = get_user_model().objects.create(username='ravi')
+        Address.objects.get_or_create_deduped(self.user, **ADDRESS)
+        _, created = Address.objects.get_or_create_deduped(other, **ADDRESS)
+        self.assertTrue(created)
+
+    def test_save_update_fields_persists_dedup_key(self):
+        address = Address.objects.create(user=self.user, **ADDRESS)
+        old_key = address.dedup_key
+
+        address.line2 = 'Near the metro'
+        address.save(update_fields=['line2'])
+
+        stored = Address.objects.get(pk=address.pk)
+        self.assertNotEqual(stored.dedup_key, old_key)
+        self.assertEqual(stored.dedup_key, _addr_key(stored))
+
+    def test_edit_into_duplicate_raises(self):
+        Address.objects.create(user=self.user, **ADDRESS)
+        other = Address.objects.create(user=self.user, **{**ADDRESS, 'line1': '14 MG Road'})
+
+        other.line1 = '12 mg road'
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            other.save()
+
+
+class DedupeAddressesMigrationTests(TestCase):
+    def test_folds_duplicates_into_oldest(self):
+        dedupe_addresses = import_module('customers.migrations.0003_address_dedup_key').dedupe_addresses
+        user = get_user_model().objects.create(username='asha')
+        kept = Address.objects.create(user=user, **ADDRESS)
+        copy = Address.objects.create(user=user, is_default=True, **{**ADDRESS, 'city': 'Mysuru'})
+        distinct = Address.objects.create(user=user, **{**ADDRESS, 'pincode': '560002'})
+        order = Order.objects.create(user=user, subtotal=1, grand_total=1, billing_address=kept, shipping_address=copy)
+        # Pre-migration rows had no key; make them unique so the constraint allows the duplicate
+        for address in (kept, copy, distinct):
+            Address.objects.filter(pk=address.pk).update(dedup_key=address.pk.hex)
+        Address.objects.filter(pk=copy.pk).update(city=' bengaluru ')
+
+        dedupe_addresses(apps, None)
+
+        self.assertQuerySetEqual(Address.objects.order_by('created_at'), [kept, distinct])
+        kept.refresh_from_db()
+        self.assertEqual(kept.dedup_key, _addr_key(kept))
+        self.assertTrue(kept.is_default)
+        order.refresh_from_db()
+        self.assertEqual((order.billing_address_id, order.shipping_address_id), (kept.pk, kept.pk))
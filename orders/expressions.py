@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class OrderNumber(models.Func):
+    """Database-allocated order number, ``ORD-<year>-<suffix>``, at most 20 characters.
+
+    PostgreSQL draws the suffix from order_number_seq, zero-padded to at least
+    six digits. Other backends have no sequence a column default can call and
+    use ``random_hex`` random hex digits instead; a collision fails the INSERT
+    on the unique constraint rather than reusing a number.
+    """
+
+    template = "'ORD-' || substr(date('now'), 1, 4) || '-' || substr(hex(randomblob(%(random_bytes)s)), 1, %(random_hex)s)"
+    output_field = models.CharField(max_length=20)
+
+    def __init__(self, random_hex, **extra):
+        super().__init__(random_hex=random_hex, random_bytes=(random_hex + 1) // 2, **extra)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        # Not yet run against a PostgreSQL server; the tests only compile it.
+        # lpad to 6 would truncate serials past 999999, so pad wide and strip
+        # the surplus leading zeros instead.
+        template = (
+            "'ORD-' || to_char(now(), 'YYYY') || '-' || "
+            "regexp_replace(lpad(nextval('order_number_seq')::text, 11, '0'), '^0+(?=[0-9]{6})', '')"
+        )
+        return self.as_sql(compiler, connection, template=template, **extra_context)
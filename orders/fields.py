@@ -0,0 +1,47 @@
+import json
+import zlib
+
+from django.db import models
+
+
+class CompressedJSONField(models.BinaryField):
+    """JSON document stored zlib-compressed in a binary column.
+
+    For write-once/read-rare payloads such as provider webhooks: rows stay
+    small and the database never parses the document. Values round-trip as
+    plain Python objects, but JSON key lookups are not available. Like
+    JSONField without an encoder, values that aren't JSON types (Decimal,
+    datetime) raise TypeError instead of coming back as strings.
+    """
+
+    def __init__(self, *args, level=6, **kwargs):
+        self.level = level
+        kwargs.setdefault('default', dict)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.level != 6:
+            kwargs['level'] = self.level
+        return name, path, args, kwargs
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return json.loads(zlib.decompress(value))
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return json.loads(zlib.decompress(value))
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        payload = json.dumps(value, separators=(',', ':'))
+        return zlib.compress(payload.encode(), self.level)
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj))
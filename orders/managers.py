@@ -0,0 +1,111 @@
+from django.db import connections, models, router, transaction
+from django.db.models import F, Q
+
+
+class UpsertManager(models.Manager):
+    def bulk_upsert(self, objs, conflict_fields, update_fields=(), increment_fields=(), batch_size=None):
+        """INSERT ... ON CONFLICT (conflict_fields) DO UPDATE, one statement per batch.
+
+        ``update_fields`` take the incoming value, ``increment_fields`` add it to
+        the stored value (e.g. merging a guest cart's quantities). Primary keys
+        on objs are only meaningful for rows that were actually inserted.
+        Objs sharing a conflict key are first merged into the earliest one, as
+        if upserted in turn, since PostgreSQL refuses to touch a row twice in
+        one statement. Returns the number of rows inserted or updated.
+        """
+        opts = self.model._meta
+        merged = {}
+        for obj in objs:
+            first = merged.setdefault(tuple(getattr(obj, opts.get_field(name).attname) for name in conflict_fields), obj)
+            if first is obj:
+                continue
+            for attname in (opts.get_field(name).attname for name in update_fields):
+                setattr(first, attname, getattr(obj, attname))
+            for attname in (opts.get_field(name).attname for name in increment_fields):
+                setattr(first, attname, getattr(first, attname) + getattr(obj, attname))
+        objs = list(merged.values())
+        if not objs:
+            return 0
+        db = router.db_for_write(self.model)
+        connection = connections[db]
+        qn = connection.ops.quote_name
+        table = qn(opts.db_table)
+
+        fields = [f for f in opts.concrete_fields if not f.generated]
+        refreshed = [opts.get_field(name).column for name in update_fields]
+        refreshed += [f.column for f in fields if getattr(f, 'auto_now', False) and f.column not in refreshed]
+        assignments = [f'{qn(col)} = EXCLUDED.{qn(col)}' for col in refreshed]
+        assignments += [
+            f'{qn(col)} = {table}.{qn(col)} + EXCLUDED.{qn(col)}'
+            for col in (opts.get_field(name).column for name in increment_fields)
+        ]
+        conflict = ', '.join(qn(opts.get_field(name).column) for name in conflict_fields)
+        on_conflict = f'DO UPDATE SET {", ".join(assignments)}' if increment_fields or update_fields else 'DO NOTHING'
+        columns = ', '.join(qn(f.column) for f in fields)
+        row = f'({", ".join(["%s"] * len(fields))})'
+
+        batch_size = min(batch_size or len(objs), connection.ops.bulk_batch_size(fields, objs))
+        rows = 0
+        with transaction.atomic(using=db, savepoint=False), connection.cursor() as cursor:
+            for start in range(0, len(objs), batch_size):
+                batch = objs[start:start + batch_size]
+                params = [f.get_db_prep_save(f.pre_save(obj, True), connection) for obj in batch for f in fields]
+                cursor.execute(
+                    f'INSERT INTO {table} ({columns}) VALUES {", ".join([row] * len(batch))} '
+                    f'ON CONFLICT ({conflict}) {on_conflict}',
+                    params,
+                )
+                rows += cursor.rowcount
+        return rows
+
+
+class CouponManager(UpsertManager):
+    def atomic_increment(self, code):
+        """Consume one use of ``code``; False if the coupon is unknown or used up.
+
+        The limit check and increment happen in a single UPDATE, so concurrent
+        checkouts cannot overshoot usage_limit.
+        """
+        within_limit = Q(usage_limit__isnull=True) | Q(used_count__lt=F('usage_limit'))
+        return self.filter(within_limit, code=code).update(used_count=F('used_count') + 1) == 1
+
+
+def _delete_dependents(model, pks, using):
+    for rel in model._meta.related_objects:
+        if rel.on_delete is models.DO_NOTHING:
+            continue
+        if rel.many_to_many or rel.on_delete is not models.CASCADE:
+            raise ValueError(
+                f'fast_delete() only follows CASCADE foreign keys; '
+                f'{rel.related_model.__name__}.{rel.field.name} is not one'
+            )
+        children = rel.related_model._base_manager.using(using).filter(**{f'{rel.field.name}__in': pks})
+        if rel.related_model._meta.related_objects:
+            # Lazy is safe here: the filter only reads the parent keys, and the
+            # grandchildren are deleted before these rows are.
+            _delete_dependents(rel.related_model, children.values('pk'), using)
+        children._raw_delete(using)
+
+
+class BulkDeleteQuerySet(models.QuerySet):
+    def fast_delete(self):
+        """Delete these rows and their CASCADE dependents with one DELETE per table per batch.
+
+        Only the primary keys of these rows are loaded into Python, in batches
+        sized to the backend's parameter limit, and no pre/post_delete signals
+        are sent, so only use it where no receivers need to run.
+        Returns the number of rows deleted from this queryset's table.
+        """
+        with transaction.atomic(using=self.db, savepoint=False):
+            # Resolve the rows up front: a lazy subquery would be re-run after the
+            # children are gone, and filters through them would then match nothing.
+            pks = list(self.values_list('pk', flat=True))
+            if not pks:
+                return 0
+            batch_size = connections[self.db].ops.bulk_batch_size(['pk'], pks)
+            deleted = 0
+            for start in range(0, len(pks), batch_size):
+                batch = pks[start:start + batch_size]
+                _delete_dependents(self.model, batch, self.db)
+                deleted += self.model._base_manager.using(self.db).filter(pk__in=batch)._raw_delete(self.db)
+            return deleted
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:33
+
+import common.uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cart',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='cartitem',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='coupon',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='returnrequest',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='shipment',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='wishlist',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='wishlistitem',
+            name='id',
+            field=models.UUIDField(default=common.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
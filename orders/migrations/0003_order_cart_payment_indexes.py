@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_uuid7_primary_keys'),
+        ('orders', '0002_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='cart',
+            name='orders_cart_user_id_df57ee_idx',
+        ),
+        migrations.AlterField(
+            model_name='cart',
+            name='user',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='carts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='user',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='order',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='orders.order'),
+        ),
+        migrations.AddIndex(
+            model_name='cart',
+            index=models.Index(fields=['user', 'is_active', 'session_key'], name='cart_user_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='ord_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['order', 'status'], name='pay_order_status'),
+        ),
+    ]
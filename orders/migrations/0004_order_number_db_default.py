@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:37
+
+import orders.expressions
+from django.db import migrations, models
+
+
+# The number default on PostgreSQL calls nextval('order_number_seq'); start it
+# past any existing ORD-YYYY-NNNNNN numbers. Other backends don't need it.
+def create_order_number_seq(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE SEQUENCE IF NOT EXISTS order_number_seq')
+        schema_editor.execute(
+            "SELECT setval('order_number_seq', COALESCE(MAX(substring(number FROM '[0-9]+$')::bigint), 0) + 1, false) "
+            "FROM orders_order WHERE number ~ '^ORD-[0-9]{4}-[0-9]+$'"
+        )
+
+
+def drop_order_number_seq(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP SEQUENCE IF EXISTS order_number_seq')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_order_cart_payment_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_order_number_seq, drop_order_number_seq),
+        migrations.RemoveIndex(
+            model_name='order',
+            name='orders_orde_number_8b11df_idx',
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='number',
+            field=models.CharField(db_default=orders.expressions.OrderNumber(random_hex=8), editable=False, max_length=20, unique=True),
+        ),
+    ]
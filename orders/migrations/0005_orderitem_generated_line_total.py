@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:38
+
+import django.db.models.deletion
+import django.db.models.expressions
+from django.db import migrations, models
+from django.db.models import F
+
+
+def restore_line_total(apps, schema_editor):
+    OrderItem = apps.get_model('orders', 'OrderItem')
+    OrderItem.objects.update(line_total=F('unit_price') * F('quantity'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0007_category_facet_counts'),
+        ('orders', '0004_order_number_db_default'),
+    ]
+
+    operations = [
+        # Columns can't be altered into generated ones; drop and re-add instead.
+        # The temporary default and restore step only matter when unapplying.
+        migrations.AlterField(
+            model_name='orderitem',
+            name='line_total',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, restore_line_total),
+        migrations.RemoveField(
+            model_name='orderitem',
+            name='line_total',
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='line_total',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('unit_price'), '*', models.F('quantity')), output_field=models.DecimalField(decimal_places=2, max_digits=12)),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='order',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='orders.order'),
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=models.Index(fields=['order', 'line_total', 'quantity'], name='oi_order_covering'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:39
+
+import orders.fields
+from django.db import migrations, models
+
+
+def copy_meta(source, target):
+    def copy(apps, schema_editor):
+        Payment = apps.get_model('orders', 'Payment')
+        batch = []
+        for payment in Payment.objects.only('pk', source).iterator(chunk_size=1000):
+            setattr(payment, target, getattr(payment, source))
+            batch.append(payment)
+            if len(batch) == 1000:
+                Payment.objects.bulk_update(batch, [target])
+                batch = []
+        Payment.objects.bulk_update(batch, [target])
+    return copy
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_orderitem_generated_line_total'),
+    ]
+
+    # jsonb can't be cast to bytea in place, so copy through a new column
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='meta_packed',
+            field=orders.fields.CompressedJSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(copy_meta('meta', 'meta_packed'), copy_meta('meta_packed', 'meta')),
+        migrations.RemoveField(
+            model_name='payment',
+            name='meta',
+        ),
+        migrations.RenameField(
+            model_name='payment',
+            old_name='meta_packed',
+            new_name='meta',
+        ),
+    ]
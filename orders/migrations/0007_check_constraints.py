@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0008_check_constraints'),
+        ('orders', '0006_payment_meta_compressed'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='cartitem',
+            constraint=models.CheckConstraint(condition=models.Q(('quantity__gte', 1)), name='cartitem_qty_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='coupon',
+            constraint=models.CheckConstraint(condition=models.Q(('percent_off__isnull', True), ('amount_off__isnull', True), _connector='OR'), name='coupon_one_discount_kind'),
+        ),
+        migrations.AddConstraint(
+            model_name='coupon',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('percent_off__gte', 0), ('percent_off__lte', 100)), ('percent_off__isnull', True), _connector='OR'), name='coupon_percent_off_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='coupon',
+            constraint=models.CheckConstraint(condition=models.Q(('amount_off__gte', 0), ('amount_off__isnull', True), _connector='OR'), name='coupon_amount_off_nonneg'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def null_guest_session_keys(apps, schema_editor):
+    Cart = apps.get_model('orders', 'Cart')
+    Cart.objects.filter(session_key='').update(session_key=None)
+    # Keep only the newest active cart per user / guest session
+    stale = []
+    seen = set()
+    active = Cart.objects.filter(is_active=True).order_by('-created_at').values_list('pk', 'user', 'session_key')
+    for pk, user_id, session_key in active:
+        key = ('user', user_id) if user_id is not None else ('session', session_key)
+        if key[1] is None:
+            continue
+        if key in seen:
+            stale.append(pk)
+        seen.add(key)
+    Cart.objects.filter(pk__in=stale).update(is_active=False)
+
+
+def blank_guest_session_keys(apps, schema_editor):
+    Cart = apps.get_model('orders', 'Cart')
+    Cart.objects.filter(session_key__isnull=True).update(session_key='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_check_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cart',
+            name='session_key',
+            field=models.CharField(blank=True, max_length=40, null=True),
+        ),
+        migrations.RunPython(null_guest_session_keys, blank_guest_session_keys),
+        migrations.AddConstraint(
+            model_name='cart',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True), ('user__isnull', True)), fields=('session_key',), name='one_active_guest_cart'),
+        ),
+        migrations.AddConstraint(
+            model_name='cart',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True), ('user__isnull', False)), fields=('user',), name='one_active_user_cart'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:42
+
+import common.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0009_created_at_brin_indexes'),
+        ('customers', '0002_uuid7_primary_keys'),
+        ('orders', '0008_cart_active_uniqueness'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='shipment',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=common.indexes.PortableBrinIndex(fields=['created_at'], name='order_created_brin', pages_per_range=32),
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=common.indexes.PortableBrinIndex(fields=['created_at'], name='orderitem_created_brin', pages_per_range=32),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=common.indexes.PortableBrinIndex(fields=['created_at'], name='payment_created_brin', pages_per_range=32),
+        ),
+        migrations.AddIndex(
+            model_name='shipment',
+            index=common.indexes.PortableBrinIndex(fields=['created_at'], name='shipment_created_brin', pages_per_range=32),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0011_review_keyset_index'),
+        ('customers', '0003_address_dedup_key'),
+        ('orders', '0009_created_at_brin_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='order_created_brin',
+        ),
+        migrations.RemoveIndex(
+            model_name='orderitem',
+            name='orderitem_created_brin',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['-created_at', '-id'], name='order_ks'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='ord_user_ks'),
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=models.Index(fields=['-created_at', '-id'], name='orderitem_ks'),
+        ),
+    ]
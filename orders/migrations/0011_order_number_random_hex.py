@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:59
+
+import orders.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0010_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='number',
+            field=models.CharField(db_default=orders.expressions.OrderNumber(random_hex=11), editable=False, max_length=20, unique=True),
+        ),
+    ]
@@ -1,9 +1,24 @@
-import uuid
+from decimal import ROUND_HALF_UP, Decimal
+
 from django.db import models
+from django.db.models import F
 from django.conf import settings
 
+from common.indexes import PortableBrinIndex
+from common.keyset import KeysetMixin
+from common.uuid import uuid7
+
+from .expressions import OrderNumber
+from .fields import CompressedJSONField
+from .managers import BulkDeleteQuerySet, CouponManager, UpsertManager
+
+# Shared Decimal constants so money defaults and rounding don't re-parse literals
+_ZERO = Decimal('0')
+_Q2 = Decimal('0.01')
+_HUNDRED = Decimal('100')
+
 class TimeStampedModel(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     class Meta:
@@ -20,23 +35,46 @@ class Coupon(TimeStampedModel):
     usage_limit = models.PositiveIntegerField(null=True, blank=True)
     used_count = models.PositiveIntegerField(default=0)
 
+    objects = CouponManager()
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(condition=models.Q(percent_off__isnull=True) | models.Q(amount_off__isnull=True), name='coupon_one_discount_kind'),
+            models.CheckConstraint(condition=models.Q(percent_off__gte=0, percent_off__lte=100) | models.Q(percent_off__isnull=True), name='coupon_percent_off_range'),
+            models.CheckConstraint(condition=models.Q(amount_off__gte=0) | models.Q(amount_off__isnull=True), name='coupon_amount_off_nonneg'),
+        ]
+
+    def discount_for(self, subtotal):
+        if self.percent_off is not None:
+            return (subtotal * self.percent_off / _HUNDRED).quantize(_Q2, rounding=ROUND_HALF_UP)
+        if self.amount_off is not None:
+            return min(self.amount_off, subtotal)
+        return _ZERO
+
 class Cart(TimeStampedModel):
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='carts', null=True, blank=True, on_delete=models.SET_NULL)
-    session_key = models.CharField(max_length=40, blank=True)  # for guests
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='carts', null=True, blank=True, on_delete=models.SET_NULL, db_index=False)  # covered by cart_user_active_idx
+    session_key = models.CharField(max_length=40, null=True, blank=True)  # for guests; NULL for user carts
     currency = models.CharField(max_length=3, default='INR')
     coupon = models.ForeignKey(Coupon, null=True, blank=True, on_delete=models.SET_NULL)
     is_active = models.BooleanField(default=True)
 
     class Meta:
-        indexes = [models.Index(fields=['user', 'session_key', 'is_active'])]
+        indexes = [models.Index(fields=['user', 'is_active', 'session_key'], name='cart_user_active_idx')]
+        constraints = [
+            models.UniqueConstraint(fields=['session_key'], condition=models.Q(user__isnull=True, is_active=True), name='one_active_guest_cart'),
+            models.UniqueConstraint(fields=['user'], condition=models.Q(user__isnull=False, is_active=True), name='one_active_user_cart'),
+        ]
 
 class CartItem(TimeStampedModel):
     cart = models.ForeignKey(Cart, related_name='items', on_delete=models.CASCADE)
     variant = models.ForeignKey('catalog.ProductVariant', related_name='cart_items', on_delete=models.PROTECT)
     quantity = models.PositiveIntegerField(default=1)
 
+    objects = UpsertManager()
+
     class Meta:
         unique_together = [('cart', 'variant')]
+        constraints = [models.CheckConstraint(condition=models.Q(quantity__gte=1), name='cartitem_qty_positive')]
 
 class Wishlist(TimeStampedModel):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='wishlists', on_delete=models.CASCADE)
@@ -49,10 +87,13 @@ class WishlistItem(TimeStampedModel):
     wishlist = models.ForeignKey(Wishlist, related_name='items', on_delete=models.CASCADE)
     product = models.ForeignKey('catalog.Product', related_name='wishlisted_in', on_delete=models.CASCADE)
 
+    objects = UpsertManager()
+
     class Meta:
         unique_together = [('wishlist', 'product')]
 
-class Order(TimeStampedModel):
+class Order(KeysetMixin, TimeStampedModel):
+    created_at = models.DateTimeField(auto_now_add=True)  # indexed by order_ks, not the inherited btree
     class Status(models.TextChoices):
         PENDING = 'PENDING'
         PAID = 'PAID'
@@ -60,13 +101,13 @@ class Order(TimeStampedModel):
         CANCELLED = 'CANCELLED'
         REFUNDED = 'REFUNDED'
 
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='orders', null=True, blank=True, on_delete=models.SET_NULL)
-    number = models.CharField(max_length=20, unique=True)  # e.g., ORD-2025-000123
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='orders', null=True, blank=True, on_delete=models.SET_NULL, db_index=False)  # covered by ord_user_status_idx
+    number = models.CharField(max_length=20, unique=True, editable=False, db_default=OrderNumber(random_hex=11))  # e.g., ORD-2026-000123 on PostgreSQL, ORD-2026-373A88F7622 elsewhere
     status = models.CharField(max_length=12, choices=Status.choices, default=Status.PENDING, db_index=True)
     subtotal = models.DecimalField(max_digits=12, decimal_places=2)
-    discount_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
-    tax_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
-    shipping_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    discount_total = models.DecimalField(max_digits=12, decimal_places=2, default=_ZERO)
+    tax_total = models.DecimalField(max_digits=12, decimal_places=2, default=_ZERO)
+    shipping_total = models.DecimalField(max_digits=12, decimal_places=2, default=_ZERO)
     grand_total = models.DecimalField(max_digits=12, decimal_places=2)
     currency = models.CharField(max_length=3, default='INR')
     coupon = models.ForeignKey(Coupon, null=True, blank=True, on_delete=models.SET_NULL)
@@ -74,20 +115,40 @@ class Order(TimeStampedModel):
     billing_address = models.ForeignKey('customers.Address', related_name='+', on_delete=models.PROTECT)
     shipping_address = models.ForeignKey('customers.Address', related_name='+', on_delete=models.PROTECT)
 
-    class Meta:
-        indexes = [models.Index(fields=['number', 'status'])]
+    objects = BulkDeleteQuerySet.as_manager()
 
-class OrderItem(TimeStampedModel):
-    order = models.ForeignKey(Order, related_name='items', on_delete=models.CASCADE)
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'status', '-created_at'], name='ord_user_status_idx'),
+            # Back keyset_page() ordering, globally and for one user's orders
+            models.Index(fields=['-created_at', '-id'], name='order_ks'),
+            models.Index(fields=['user', '-created_at', '-id'], name='ord_user_ks'),
+        ]
+
+class OrderItem(KeysetMixin, TimeStampedModel):
+    created_at = models.DateTimeField(auto_now_add=True)  # indexed by orderitem_ks, not the inherited btree
+    order = models.ForeignKey(Order, related_name='items', on_delete=models.CASCADE, db_index=False)  # covered by oi_order_covering
     product = models.ForeignKey('catalog.Product', related_name='+', on_delete=models.PROTECT)
     variant = models.ForeignKey('catalog.ProductVariant', related_name='+', on_delete=models.PROTECT)
     name = models.CharField(max_length=200)
     sku = models.CharField(max_length=40)
     unit_price = models.DecimalField(max_digits=10, decimal_places=2)
     quantity = models.PositiveIntegerField()
-    line_total = models.DecimalField(max_digits=12, decimal_places=2)
+    line_total = models.GeneratedField(
+        expression=F('unit_price') * F('quantity'),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
+    )
+
+    class Meta:
+        # Key columns rather than INCLUDE so order totals stay index-only on SQLite too
+        indexes = [
+            models.Index(fields=['order', 'line_total', 'quantity'], name='oi_order_covering'),
+            models.Index(fields=['-created_at', '-id'], name='orderitem_ks'),
+        ]
 
 class Payment(TimeStampedModel):
+    created_at = models.DateTimeField(auto_now_add=True)  # indexed by payment_created_brin, not the inherited btree
     class Status(models.TextChoices):
         INITIATED = 'INITIATED'
         AUTHORIZED = 'AUTHORIZED'
@@ -95,15 +156,22 @@ class Payment(TimeStampedModel):
         FAILED = 'FAILED'
         REFUNDED = 'REFUNDED'
 
-    order = models.ForeignKey(Order, related_name='payments', on_delete=models.CASCADE)
+    order = models.ForeignKey(Order, related_name='payments', on_delete=models.CASCADE, db_index=False)  # covered by pay_order_status
     provider = models.CharField(max_length=40)  # e.g., razorpay, stripe
     amount = models.DecimalField(max_digits=12, decimal_places=2)
     currency = models.CharField(max_length=3, default='INR')
     status = models.CharField(max_length=12, choices=Status.choices, default=Status.INITIATED)
     transaction_id = models.CharField(max_length=80, blank=True)
-    meta = models.JSONField(default=dict, blank=True)
+    meta = CompressedJSONField(blank=True)  # raw provider payloads
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['order', 'status'], name='pay_order_status'),
+            PortableBrinIndex(fields=['created_at'], pages_per_range=32, name='payment_created_brin'),
+        ]
 
 class Shipment(TimeStampedModel):
+    created_at = models.DateTimeField(auto_now_add=True)  # indexed by shipment_created_brin, not the inherited btree
     class Status(models.TextChoices):
         PENDING = 'PENDING'
         SHIPPED = 'SHIPPED'
@@ -117,6 +185,9 @@ class Shipment(TimeStampedModel):
     shipped_at = models.DateTimeField(null=True, blank=True)
     delivered_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [PortableBrinIndex(fields=['created_at'], pages_per_range=32, name='shipment_created_brin')]
+
 class ReturnRequest(TimeStampedModel):
     class Reason(models.TextChoices):
         SIZE_FIT = 'SIZE_FIT'
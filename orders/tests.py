@@ -1,3 +1,244 @@
+import json
+import re
+from datetime import timedelta
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core import serializers
+from django.db import connection, transaction
 from django.test import TestCase
+from django.utils import timezone
+
+from catalog.models import Category, Product, ProductVariant
+from customers.models import Address
+
+from .expressions import OrderNumber
+from .managers import BulkDeleteQuerySet
+from .models import Cart, CartItem, Coupon, Order, OrderItem, Payment, ReturnRequest, Shipment, Wishlist, WishlistItem
+
+
+class OrderTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(username='buyer')
+        cls.address = Address.objects.create(
+            user=cls.user, full_name='Buyer', phone='1', line1='Line 1', city='City', state='State', pincode='1',
+        )
+        product = Product.objects.create(name='Shirt', category=Category.objects.create(name='Shirts'), base_price=10)
+        cls.product = product
+        cls.variant = ProductVariant.objects.create(product=product, sku='SHIRT-M', mrp_price=10, sale_price=10)
+
+    def make_order(self, sku='SHIRT-M'):
+        order = Order.objects.create(
+            user=self.user, subtotal=10, grand_total=10, billing_address=self.address, shipping_address=self.address,
+        )
+        item = OrderItem.objects.create(
+            order=order, product=self.product, variant=self.variant, name='Shirt', sku=sku, unit_price=10, quantity=1,
+        )
+        ReturnRequest.objects.create(order=order, order_item=item, reason=ReturnRequest.Reason.OTHER)
+        Payment.objects.create(order=order, provider='razorpay', amount=10)
+        Shipment.objects.create(order=order)
+        return order
+
+
+class UpsertManagerTests(OrderTestCase):
+    def test_increment_merges_guest_cart(self):
+        cart = Cart.objects.create(user=self.user)
+        CartItem.objects.create(cart=cart, variant=self.variant, quantity=2)
+        other = ProductVariant.objects.create(product=self.product, sku='SHIRT-L', mrp_price=10, sale_price=10)
+        guest_items = [
+            CartItem(cart=cart, variant=self.variant, quantity=5),
+            CartItem(cart=cart, variant=self.variant, quantity=1),  # same key twice in one batch
+            CartItem(cart=cart, variant=other, quantity=1),
+        ]
+
+        self.assertEqual(CartItem.objects.bulk_upsert(guest_items, ['cart', 'variant'], increment_fields=['quantity']), 2)
+
+        self.assertEqual(dict(cart.items.values_list('variant__sku', 'quantity')), {'SHIRT-M': 8, 'SHIRT-L': 1})
+        # Merged before the INSERT; PostgreSQL would reject the key appearing twice
+        self.assertEqual(guest_items[0].quantity, 6)
+
+    def test_update_fields_reupload_coupons(self):
+        Coupon.objects.create(code='SAVE10', percent_off=10, description='Old', used_count=3)
+        campaign = [
+            Coupon(code='SAVE10', percent_off=15, description='Draft'),
+            Coupon(code='SAVE10', percent_off=20, description='Final'),
+            Coupon(code='NEW5', percent_off=5),
+        ]
+
+        Coupon.objects.bulk_upsert(campaign, ['code'], update_fields=['percent_off', 'description'])
+
+        self.assertQuerySetEqual(
+            Coupon.objects.order_by('code').values_list('code', 'percent_off', 'description', 'used_count'),
+            [('NEW5', 5, '', 0), ('SAVE10', 20, 'Final', 3)],
+        )
+
+    def test_do_nothing_keeps_existing_rows(self):
+        wishlist = Wishlist.objects.create(user=self.user)
+        existing = WishlistItem.objects.create(wishlist=wishlist, product=self.product)
+        other = Product.objects.create(name='Tee', category=self.product.category, base_price=10)
+        items = [WishlistItem(wishlist=wishlist, product=p) for p in (self.product, other, other)]
+
+        self.assertEqual(WishlistItem.objects.bulk_upsert(items, ['wishlist', 'product']), 1)
+
+        self.assertEqual(wishlist.items.count(), 2)
+        self.assertTrue(WishlistItem.objects.filter(pk=existing.pk).exists())
+
+    def test_batch_size(self):
+        coupons = [Coupon(code=f'C{i}', amount_off=i) for i in range(5)]
+        with self.assertNumQueries(3):
+            self.assertEqual(Coupon.objects.bulk_upsert(coupons, ['code'], batch_size=2), 5)
+        self.assertEqual(Coupon.objects.count(), 5)
+
+    def test_atomic_increment_stops_at_usage_limit(self):
+        Coupon.objects.create(code='TWICE', amount_off=5, usage_limit=2)
+        self.assertEqual([Coupon.objects.atomic_increment('TWICE') for _ in range(3)], [True, True, False])
+        self.assertEqual(Coupon.objects.get(code='TWICE').used_count, 2)
+        self.assertFalse(Coupon.objects.atomic_increment('MISSING'))
+
+
+class CompressedJSONFieldTests(OrderTestCase):
+    def setUp(self):
+        self.payment = self.make_order().payments.get()
+
+    def test_round_trip(self):
+        for meta in ({'event': 'payment.captured', 'amount': 1000, 'notes': [1, None]}, ['a', {'b': 2.5}], {}):
+            with self.subTest(meta=meta):
+                Payment.objects.filter(pk=self.payment.pk).update(meta=meta)
+                self.assertEqual(Payment.objects.get(pk=self.payment.pk).meta, meta)
+
+    def test_default(self):
+        self.assertEqual(Payment.objects.get(pk=self.payment.pk).meta, {})
+        self.assertEqual(Payment().meta, {})
+
+    def test_none(self):
+        field = Payment._meta.get_field('meta')
+        self.assertIsNone(field.get_prep_value(None))
+        self.assertIsNone(field.from_db_value(None, None, connection))
+
+    def test_serialization(self):
+        self.payment.meta = {'id': 'pay_1', 'items': [1, 2]}
+        self.payment.save()
+        data = serializers.serialize('json', [self.payment])
+        self.assertEqual(json.loads(data)[0]['fields']['meta'], '{"id": "pay_1", "items": [1, 2]}')
+        Payment.objects.filter(pk=self.payment.pk).update(meta={})
+
+        for obj in serializers.deserialize('json', data):
+            obj.save()
+        self.assertEqual(Payment.objects.get(pk=self.payment.pk).meta, {'id': 'pay_1', 'items': [1, 2]})
+
+    def test_decimal_rejected(self):
+        self.payment.meta = {'amount': Decimal('1.5')}
+        with self.assertRaises(TypeError):
+            self.payment.save()
+
+
+class FastDeleteTests(OrderTestCase):
+    def test_cascades_to_dependents(self):
+        order, kept = self.make_order(), self.make_order()
+
+        # One SELECT for the order pks, then one DELETE per table
+        with self.assertNumQueries(7):
+            self.assertEqual(Order.objects.filter(pk=order.pk).fast_delete(), 1)
+
+        self.assertQuerySetEqual(Order.objects.all(), [kept])
+        for model in (OrderItem, ReturnRequest, Payment, Shipment):
+            self.assertQuerySetEqual(model.objects.values_list('order', flat=True), [kept.pk], msg=model.__name__)
+
+    def test_filter_through_deleted_relation(self):
+        order, kept = self.make_order(sku='GONE'), self.make_order()
+
+        self.assertEqual(Order.objects.filter(items__sku='GONE').fast_delete(), 1)
+
+        self.assertFalse(Order.objects.filter(pk=order.pk).exists())
+        self.assertTrue(Order.objects.filter(pk=kept.pk).exists())
+        self.assertEqual(OrderItem.objects.count(), 1)
+
+    def test_batches(self):
+        kept = self.make_order()
+        for _ in range(3):
+            self.make_order(sku='GONE')
+        with patch.object(connection.ops, 'bulk_batch_size', return_value=2):
+            self.assertEqual(Order.objects.filter(items__sku='GONE').fast_delete(), 3)
+        self.assertQuerySetEqual(Order.objects.all(), [kept])
+        self.assertEqual(ReturnRequest.objects.count(), 1)
+
+    def test_empty_queryset(self):
+        self.make_order()
+        with self.assertNumQueries(1):
+            self.assertEqual(Order.objects.filter(items__sku='NONE').fast_delete(), 0)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_rejects_non_cascade_relations(self):
+        coupon = Coupon.objects.create(code='SAVE10', percent_off=10)
+        with self.assertRaisesMessage(ValueError, 'only follows CASCADE'), transaction.atomic():
+            BulkDeleteQuerySet(model=Coupon).filter(pk=coupon.pk).fast_delete()
+        self.assertTrue(Coupon.objects.filter(pk=coupon.pk).exists())
+
+
+class KeysetPageTests(OrderTestCase):
+    def setUp(self):
+        # Two timestamps, three orders each: pages must split ties without skipping or repeating
+        now = timezone.now()
+        for ts in (now, now - timedelta(minutes=1)):
+            for _ in range(3):
+                Order.objects.filter(pk=self.make_order().pk).update(created_at=ts)
+        self.newest_first = list(Order.objects.order_by('-created_at', '-pk'))
+
+    def paginate(self, limit, queryset=None):
+        pages, after = [], None
+        while page := Order.keyset_page(after=after, limit=limit, queryset=queryset):
+            pages.append(page)
+            after = (page[-1].created_at, page[-1].pk)
+        return pages
+
+    def test_pages_split_ties(self):
+        pages = self.paginate(limit=2)
+        self.assertEqual([len(page) for page in pages], [2, 2, 2])
+        self.assertEqual([order for page in pages for order in page], self.newest_first)
+
+    def test_page_boundary_on_timestamp_change(self):
+        pages = self.paginate(limit=3)
+        self.assertEqual([len({o.created_at for o in page}) for page in pages], [1, 1])
+        self.assertEqual([order for page in pages for order in page], self.newest_first)
+
+    def test_cursor_after_last_row(self):
+        last = self.newest_first[-1]
+        self.assertEqual(Order.keyset_page(after=(last.created_at, last.pk)), [])
+
+    @skipUnless(connection.vendor == 'sqlite', 'checks the SQLite query plan')
+    def test_cursor_seeks_index(self):
+        last = self.newest_first[2]
+        after = (last.created_at, last.pk)
+        plan = Order.keyset_queryset(after)[:20].explain()
+        self.assertIn('SEARCH orders_order USING INDEX order_ks (created_at<?)', plan)
+        plan = Order.keyset_queryset(after, queryset=Order.objects.filter(user=self.user))[:20].explain()
+        self.assertIn('SEARCH orders_order USING INDEX ord_user_ks (user_id=? AND created_at<?)', plan)
+
+    def test_narrowed_queryset(self):
+        other = get_user_model().objects.create(username='other')
+        Order.objects.filter(pk__in=[o.pk for o in self.newest_first[1::2]]).update(user=other)
+        pages = self.paginate(limit=2, queryset=Order.objects.filter(user=other))
+        self.assertEqual([order for page in pages for order in page], self.newest_first[1::2])
+
+
+class OrderNumberTests(OrderTestCase):
+    def test_number_fills_field(self):
+        numbers = {self.make_order().number for _ in range(20)}
+        self.assertEqual(len(numbers), 20)
+        year = timezone.now().year
+        for number in numbers:
+            self.assertRegex(number, rf'^ORD-{year}-[0-9A-F]{{11}}$')
 
-# Create your tests here.
+    def test_postgresql_sql(self):
+        # No PostgreSQL server in the test setup: compile the template and check
+        # its padding pattern, which Python's re reads the same way.
+        compiler = Order.objects.all().query.get_compiler(connection=connection)
+        sql, params = OrderNumber(random_hex=11).as_postgresql(compiler, connection)
+        self.assertEqual(params, [])
+        self.assertIn("lpad(nextval('order_number_seq')::text, 11, '0')", sql)
+        pattern = re.search(r"'(\^0\+[^']*)'", sql)[1]
+        for serial, suffix in [(1, '000001'), (999999, '999999'), (1000000, '1000000'), (10**10, '10000000000')]:
+            self.assertEqual(re.sub(pattern, '', str(serial).rjust(11, '0')), suffix)